@@ -1,12 +1,19 @@
+import asyncio
 import json
 import logging
+import os
+import queue
 import time
 import uuid
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator, Dict, cast
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api.middleware import (
     AuditMiddleware,
@@ -31,6 +38,16 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    # Bound the default executor to the core count. Predictor.apredict offloads
+    # sklearn inference via asyncio.to_thread, which uses this executor; the
+    # asyncio default (min(32, cores + 4)) oversubscribes BLAS threads under
+    # concurrent load and thrashes instead of parallelizing.
+    executor = ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 1, thread_name_prefix="inference"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    app.state.inference_executor = executor
+
     try:
         app.state.predictor = Predictor(settings.model_path, settings.config_path)
         logger.info("Model loaded successfully")
@@ -56,10 +73,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         if settings.breaker_enabled
         else None
     )
+    # Route all logging through a background thread: the hot-path
+    # logger.info calls become a queue put, while formatting and the
+    # stdout write happen off the request path. Call sites are unchanged.
+    # Installed after model loading so a failed startup leaves the
+    # original handlers in place.
+    root_logger = logging.getLogger()
+    original_handlers = root_logger.handlers[:]
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    log_listener = QueueListener(
+        log_queue, *original_handlers, respect_handler_level=True
+    )
+    root_logger.handlers = [QueueHandler(log_queue)]
+    log_listener.start()
     logger.info("Application startup complete")
     yield
     logger.info("Application shutdown initiated")
     # Clean up resources if needed (e.g. close DB connections)
+    executor.shutdown(wait=True)
+    # Drain queued records and restore direct handlers so repeated
+    # startup/shutdown cycles (tests, reloads) never chain queue handlers
+    log_listener.stop()
+    root_logger.handlers = original_handlers
 
 
 app = FastAPI(
@@ -71,6 +106,9 @@ app = FastAPI(
         "Model: TF-IDF + Calibrated Logistic Regression."
     ),
     lifespan=lifespan,
+    # orjson serializes the float-heavy prediction payloads several times
+    # faster than stdlib json and handles numpy scalars natively
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -87,6 +125,11 @@ app.add_middleware(
     ],
 )
 
+# Compress large responses for clients that accept it — /batch CSV bodies
+# carry natural-language columns that compress 5-10x. Small payloads
+# (/health, single predictions) pass through untouched.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.add_middleware(SecurityHeadersMiddleware)
 if settings.audit_log_enabled:
     app.add_middleware(AuditMiddleware)
@@ -1,16 +1,23 @@
 #!/bin/bash
 set -e
 
-# Default to (2 * cores) + 1 workers if not set, or 1 if detection fails
+# Default to one worker per core if not set, or 1 if detection fails.
+# Inference is CPU-bound, so the classic (2 * cores) + 1 sizing for
+# I/O-bound apps just adds context switching here.
 if [ -z "$WORKERS" ]; then
   if command -v nproc > /dev/null; then
-    CORES=$(nproc)
-    WORKERS=$((CORES * 2 + 1))
+    WORKERS=$(nproc)
   else
     WORKERS=1
   fi
 fi
 
+# Pin BLAS to one thread per worker. Without this, N workers each spawn
+# a full BLAS thread pool (N workers x M threads) and thrash the cores.
+export OMP_NUM_THREADS=${OMP_NUM_THREADS:-1}
+export OPENBLAS_NUM_THREADS=${OPENBLAS_NUM_THREADS:-1}
+export MKL_NUM_THREADS=${MKL_NUM_THREADS:-1}
+
 echo "Starting Gunicorn with $WORKERS workers..."
 
 exec gunicorn -k uvicorn.workers.UvicornWorker \
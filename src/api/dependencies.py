@@ -74,6 +74,11 @@ def resolve_threshold(predictor: Optional[BasePredictor] = None) -> float:
     if settings.decision_threshold is not None:
         return float(settings.decision_threshold)
     if predictor is not None:
+        # Predictor hoists the config threshold at load time; avoid the
+        # per-request dict lookup when that attribute is available.
+        default = getattr(predictor, "default_threshold", None)
+        if isinstance(default, (int, float)):
+            return float(default)
         try:
             return float(predictor.config["optimal_threshold"])
         except (KeyError, TypeError, ValueError) as exc:
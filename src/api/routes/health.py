@@ -1,4 +1,6 @@
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict
 from fastapi import APIRouter, Depends, Request, Response, status
 from src.api.dependencies import require_api_key
@@ -9,6 +11,18 @@ from src.utils.circuit_breaker import CircuitBreaker
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
+def _iso_timestamp(epoch_seconds: int) -> str:
+    """Format an ISO-8601 UTC timestamp, cached at second granularity.
+
+    /health is probed frequently by orchestrators; second resolution means
+    the datetime construction and strftime run at most once per second.
+    """
+    return datetime.fromtimestamp(epoch_seconds, tz=timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+
+
 @router.get("/health")
 def health(request: Request, response: Response) -> Dict[str, Any]:
     """Health check endpoint with model and circuit breaker status.
@@ -27,7 +41,7 @@ def health(request: Request, response: Response) -> Dict[str, Any]:
         "status": "healthy" if is_healthy else "unhealthy",
         "model_loaded": predictor is not None,
         "service_degraded": False,
-        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "timestamp": _iso_timestamp(int(time.time())),
     }
 
     if not is_healthy:
@@ -1,5 +1,6 @@
 import json
 import logging
+from collections import Counter
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from src.api.schemas import PredictRequest, PredictResponse, PredictionResult
@@ -72,14 +73,56 @@ async def predict(
         except Exception:
             raise HTTPException(status_code=503, detail="Inference error")
     per_item_latency = latency / max(len(labels), 1)
-    for label in labels:
-        metrics.record_prediction(label, per_item_latency)
+    metrics.record_batch(labels, per_item_latency)
+    logger.info(
+        json.dumps(
+            {
+                "event": "predict_completed",
+                "correlation_id": getattr(req.state, "correlation_id", None),
+                "text_count": len(texts),
+                "decision_threshold": threshold,
+                "latency_ms": round(latency * 1000, 2),
+            }
+        )
+    )
+
+    if len(texts) == 1:
+        # Specialized path for the dominant request shape (the UI sends one
+        # text per call): no zip, no comprehension, no Counter pass.
+        label = str(labels[0])
+        prob = float(probs[0])
+        risk_level, recommended_action = policy_decision(prob, threshold)
+        return PredictResponse(
+            predictions=[
+                PredictionResult.model_construct(
+                    text_hash=hash_text(texts[0]),
+                    label=label,
+                    probability_malicious=prob,
+                    threshold=threshold,
+                    risk_level=risk_level,
+                    recommended_action=recommended_action,
+                    latency_ms=per_item_latency * 1000,
+                    is_fallback=used_fallback,
+                )
+            ],
+            metadata={
+                "total_items": 1,
+                "malicious_count": int(label == "MALICIOUS"),
+                "benign_count": int(label == "BENIGN"),
+                "unknown_count": int(label == "UNKNOWN"),
+                "total_latency_ms": latency * 1000,
+                "model_version": settings.model_version,
+            },
+        )
 
     predictions = []
     for text, label, prob in zip(texts, labels, probs):
         risk_level, recommended_action = policy_decision(float(prob), threshold)
+        # model_construct skips per-row validation: every field is built
+        # server-side with the right type, and FastAPI still validates the
+        # assembled response against PredictResponse once.
         predictions.append(
-            PredictionResult(
+            PredictionResult.model_construct(
                 text_hash=hash_text(text),
                 label=str(label),
                 probability_malicious=float(prob),
@@ -90,25 +133,16 @@ async def predict(
                 is_fallback=used_fallback,
             )
         )
-    logger.info(
-        json.dumps(
-            {
-                "event": "predict_completed",
-                "correlation_id": getattr(req.state, "correlation_id", None),
-                "text_count": len(texts),
-                "decision_threshold": threshold,
-                "latency_ms": round(latency * 1000, 2),
-            }
-        )
-    )
 
+    # One Counter pass instead of a full scan per label class
+    label_counts = Counter(labels)
     return PredictResponse(
         predictions=predictions,
         metadata={
             "total_items": len(predictions),
-            "malicious_count": sum(1 for label in labels if label == "MALICIOUS"),
-            "benign_count": sum(1 for label in labels if label == "BENIGN"),
-            "unknown_count": sum(1 for label in labels if label == "UNKNOWN"),
+            "malicious_count": label_counts.get("MALICIOUS", 0),
+            "benign_count": label_counts.get("BENIGN", 0),
+            "unknown_count": label_counts.get("UNKNOWN", 0),
             "total_latency_ms": latency * 1000,
             "model_version": settings.model_version,
         },
@@ -36,6 +36,11 @@ class Settings(BaseSettings):
     rate_limit_window: int = Field(default=60, ge=1)
     max_text_length: int = Field(default=10000, ge=1)
     max_batch_items: int = Field(default=1000, ge=1)
+    batch_chunk_size: int = Field(
+        default=1024,
+        ge=1,
+        description="Rows per inference mini-batch when streaming /batch CSVs",
+    )
     max_csv_bytes: int = Field(default=10 * 1024 * 1024, ge=1)
 
     # Auth & Security
@@ -1,17 +1,27 @@
 import asyncio
+import copy
+import logging
 import os
 import time
 import hashlib
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from collections import OrderedDict
 import threading
 
 import joblib
+import numpy as np
 
 from src.inference.base import BasePredictor
 from src.config import settings
 from src.utils.text import normalize_text
 
+logger = logging.getLogger(__name__)
+
+
+def _tokens_passthrough(tokens: List[str]) -> List[str]:
+    """Identity analyzer for vectorizers fed pre-tokenized documents."""
+    return tokens
+
 
 class Predictor(BasePredictor):
     def __init__(
@@ -39,6 +49,19 @@ class Predictor(BasePredictor):
         self.config: Dict[str, Any] = joblib.load(config_path)
         pos_class = self.config["positive_class"]
         self.pos_index = list(self.model.classes_).index(pos_class)
+        # Hoisted at load time so the hot path never touches the config dict.
+        # Left as None when the config omits it — predict then falls back to
+        # the config lookup, preserving the old failure mode.
+        raw_threshold = self.config.get("optimal_threshold")
+        self.default_threshold: Optional[float] = (
+            max(0.0, min(1.0, float(raw_threshold)))
+            if raw_threshold is not None
+            else None
+        )
+
+        # Direct sparse-matmul fast path; None means use model.predict_proba
+        self._fast_analyzer: Optional[Callable[[str], List[str]]] = None
+        self._fast_folds = self._build_fast_path()
 
         # LRU cache for repeated queries (common in abuse campaigns)
         # Size limit prevents memory leaks from unique adversarial inputs
@@ -151,6 +174,107 @@ class Predictor(BasePredictor):
                 f"Expected {expected_hash}, got {calculated_hash}"
             )
 
+    def _build_fast_path(self) -> Optional[List[Tuple[Any, Any, float, Any]]]:
+        """Extract per-fold inference components for a direct scoring path.
+
+        CalibratedClassifierCV.predict_proba routes every call through
+        sklearn's generic estimator machinery: per-fold response-method
+        dispatch, repeated input validation, and probability assembly. For
+        the known model layout (calibrated folds over a tfidf+lr Pipeline)
+        the same numbers come from one sparse matvec plus the fold's
+        isotonic calibrator, so hoist those components out once at load.
+
+        Returns:
+            List of (vectorizer, coefficients, intercept, calibrator) per
+            fold, or None if the model doesn't match the expected layout
+            (predict then falls back to model.predict_proba). The result is
+            verified against model.predict_proba before being trusted.
+        """
+        try:
+            if len(self.model.classes_) != 2:
+                return None
+            folds = []
+            for cc in self.model.calibrated_classifiers_:
+                steps = cc.estimator.named_steps
+                clf = steps["lr"]
+                folds.append(
+                    (
+                        steps["tfidf"],
+                        clf.coef_[0],
+                        float(clf.intercept_[0]),
+                        cc.calibrators[0],
+                    )
+                )
+
+            # All folds are clones of one pipeline, so their analyzers
+            # (preprocessing + tokenization + ngrams) are identical even
+            # though vocabularies differ. Tokenize once and feed every fold
+            # pre-analyzed documents through a patched vectorizer copy —
+            # this drops folds-1 redundant regex passes over each text.
+            base_params = folds[0][0].get_params()
+            if any(vec.get_params() != base_params for vec, _, _, _ in folds[1:]):
+                return None
+            self._fast_analyzer = folds[0][0].build_analyzer()
+            shared = []
+            for vectorizer, coef, intercept, calibrator in folds:
+                # Copy before patching: the live model's vectorizers must
+                # keep analyzing raw strings for the predict_proba fallback
+                patched = copy.deepcopy(vectorizer)
+                patched.analyzer = _tokens_passthrough
+                shared.append((patched, coef, intercept, calibrator))
+            folds = shared
+        except (AttributeError, KeyError, IndexError, TypeError):
+            logger.warning(
+                "Model layout not recognized; using model.predict_proba directly"
+            )
+            self._fast_analyzer = None
+            return None
+
+        # Parity check: the fast path must reproduce predict_proba exactly
+        # on a smoke batch, otherwise it is discarded.
+        smoke = ["", "calibration parity smoke check"]
+        expected = self.model.predict_proba(smoke)[:, self.pos_index]
+        actual = self._score_folds(smoke, folds)
+        if not np.allclose(expected, actual, atol=1e-9):
+            logger.warning(
+                "Fast-path parity check failed (max diff %s); "
+                "using model.predict_proba directly",
+                float(np.abs(expected - actual).max()),
+            )
+            self._fast_analyzer = None
+            return None
+        return folds
+
+    def _score_folds(
+        self, texts: List[str], folds: List[Tuple[Any, Any, float, Any]]
+    ) -> Any:
+        """Score texts through the extracted folds and average.
+
+        Texts are analyzed once and the resulting token lists shared across
+        folds; each fold's decision scores are then one sparse matvec mapped
+        through its isotonic calibrator — numerically identical to
+        CalibratedClassifierCV.predict_proba for this model layout.
+
+        Args:
+            texts: Normalized input texts
+            folds: Per-fold components from _build_fast_path
+
+        Returns:
+            Array of positive-class probabilities
+        """
+        analyzer = self._fast_analyzer
+        if analyzer is None:
+            # Defensive: folds only exist once the analyzer has been built
+            raise RuntimeError("Fast path invoked without a built analyzer")
+        analyzed = [analyzer(t) for t in texts]
+        total = np.zeros(len(texts))
+        for vectorizer, coef, intercept, calibrator in folds:
+            scores = vectorizer.transform(analyzed) @ coef + intercept
+            total += calibrator.predict(scores)
+        positive = total / len(folds)
+        # Calibrators produce the probability of classes_[1]
+        return positive if self.pos_index == 1 else 1.0 - positive
+
     def _normalize_text(self, text: str) -> str:
         """Normalize text using the shared utility.
 
@@ -189,29 +313,36 @@ class Predictor(BasePredictor):
         # Sanitize input
         normalized_texts = [self._normalize_text(t) for t in texts]
 
-        # Check cache
+        # Check cache. Misses are deduplicated by text so repeated inputs in
+        # one batch (retries, duplicate CSV rows) hit the model only once.
         probs = [0.0] * len(normalized_texts)
-        miss_indices = []
-        miss_texts = []
+        miss_positions: Dict[str, List[int]] = {}
 
         for i, text in enumerate(normalized_texts):
             cached_prob = self._get_from_cache(text)
             if cached_prob is not None:
                 probs[i] = cached_prob
             else:
-                miss_indices.append(i)
-                miss_texts.append(text)
-
-        # Predict for misses
-        if miss_texts:
+                miss_positions.setdefault(text, []).append(i)
+
+        # Predict for unique misses
+        if miss_positions:
+            miss_texts = list(miss_positions)
+            # getattr: partially constructed predictors (tests patch __init__)
+            # won't have the fast-path attributes
+            fast_folds = getattr(self, "_fast_folds", None)
             try:
-                miss_probs = self.model.predict_proba(miss_texts)[:, self.pos_index]
-                for idx, prob in zip(miss_indices, miss_probs):
+                if fast_folds is not None:
+                    miss_probs = self._score_folds(miss_texts, fast_folds)
+                else:
+                    miss_probs = self.model.predict_proba(miss_texts)[:, self.pos_index]
+                for text, prob in zip(miss_texts, miss_probs):
                     # Clamp probabilities to valid range [0, 1]
                     # Some calibration methods can produce values slightly outside
                     clamped_prob = max(0.0, min(1.0, float(prob)))
-                    probs[idx] = clamped_prob
-                    self._add_to_cache(normalized_texts[idx], clamped_prob)
+                    for idx in miss_positions[text]:
+                        probs[idx] = clamped_prob
+                    self._add_to_cache(text, clamped_prob)
             except Exception as e:
                 # Wrap obscure sklearn/joblib errors with context
                 raise RuntimeError(
@@ -219,17 +350,21 @@ class Predictor(BasePredictor):
                     "This may indicate model corruption or incompatible input."
                 ) from e
 
-        # Apply threshold with defensive clamping
-        effective_threshold = (
-            float(threshold)
-            if threshold is not None
-            else float(self.config["optimal_threshold"])
-        )
-
-        # Clamp threshold to valid range
-        effective_threshold = max(0.0, min(1.0, effective_threshold))
+        # Apply threshold with defensive clamping (default is pre-clamped at load)
+        default_threshold: Optional[float] = getattr(self, "default_threshold", None)
+        if threshold is not None:
+            effective_threshold = max(0.0, min(1.0, float(threshold)))
+        elif default_threshold is not None:
+            effective_threshold = default_threshold
+        else:
+            effective_threshold = max(
+                0.0, min(1.0, float(self.config["optimal_threshold"]))
+            )
 
-        labels = ["MALICIOUS" if p >= effective_threshold else "BENIGN" for p in probs]
+        # Single vectorized comparison instead of a per-item Python loop
+        labels = np.where(
+            np.asarray(probs) >= effective_threshold, "MALICIOUS", "BENIGN"
+        ).tolist()
         latency = time.monotonic() - start_time
         return labels, probs, latency
 
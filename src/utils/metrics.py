@@ -1,7 +1,7 @@
-from collections import defaultdict
-from datetime import datetime, timezone
+import collections
 import threading
-from typing import Dict
+import time
+from typing import Dict, List
 from prometheus_client import Counter, Histogram
 
 # Global Prometheus Metrics
@@ -15,10 +15,12 @@ class Metrics:
         self._lock = threading.Lock()
         self.total_requests = 0
         self.total_predictions = 0
-        self.predictions_by_class: Dict[str, int] = defaultdict(int)
+        self.predictions_by_class: Dict[str, int] = collections.defaultdict(int)
         self.total_latency = 0.0
         self.errors = 0
-        self.start_time = datetime.now(timezone.utc)
+        # Monotonic clock for uptime: immune to wall-clock jumps and far
+        # cheaper than allocating a datetime per get_stats call
+        self._start_monotonic = time.monotonic()
 
     def record_prediction(self, label: str, latency: float) -> None:
         with self._lock:
@@ -29,6 +31,35 @@ class Metrics:
         PREDICTION_COUNT.labels(label=label).inc()
         PREDICTION_LATENCY.observe(latency)
 
+    def record_batch(self, labels: List[str], per_item_latency: float) -> None:
+        """Record a batch of predictions under a single lock acquisition.
+
+        Equivalent to calling record_prediction per label, but tallies labels
+        in one Counter pass and touches the lock once per batch instead of
+        once per item. Worker threads race on these fields otherwise.
+
+        Args:
+            labels: Predicted label per item
+            per_item_latency: Latency attributed to each item (seconds)
+        """
+        if not labels:
+            return
+        count = len(labels)
+        # collections.Counter — the prometheus Counter shadows the name here
+        label_counts = collections.Counter(labels)
+        with self._lock:
+            self.total_requests += count
+            self.total_predictions += count
+            for label, n in label_counts.items():
+                self.predictions_by_class[label] += n
+            self.total_latency += per_item_latency * count
+        for label, n in label_counts.items():
+            PREDICTION_COUNT.labels(label=label).inc(n)
+        # One observation per item keeps the histogram count equal to the
+        # number of predictions, matching record_prediction semantics
+        for _ in range(count):
+            PREDICTION_LATENCY.observe(per_item_latency)
+
     def record_error(self) -> None:
         with self._lock:
             self.errors += 1
@@ -36,7 +67,7 @@ class Metrics:
 
     def get_stats(self) -> Dict[str, object]:
         with self._lock:
-            uptime = (datetime.now(timezone.utc) - self.start_time).total_seconds()
+            uptime = time.monotonic() - self._start_monotonic
             avg_latency = (
                 self.total_latency / self.total_requests
                 if self.total_requests > 0
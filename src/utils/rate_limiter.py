@@ -14,6 +14,7 @@ class RateLimiter:
         self.window_seconds = window_seconds
         self.requests: Dict[str, Deque[float]] = defaultdict(deque)
         self._lock = threading.Lock()
+        self._last_eviction = 0.0
 
     def _cleanup(self, client_id: str, now: float) -> None:
         """Remove expired timestamps for a client.
@@ -25,9 +26,12 @@ class RateLimiter:
             client_id: Client identifier
             now: Current timestamp
         """
-        window_start = now - self.window_seconds
-        timestamps = self.requests[client_id]
+        # .get avoids materializing an empty deque for unseen clients
+        timestamps = self.requests.get(client_id)
+        if not timestamps:
+            return
 
+        window_start = now - self.window_seconds
         # Remove all timestamps older than the window
         while timestamps and timestamps[0] < window_start:
             timestamps.popleft()
@@ -49,9 +53,16 @@ class RateLimiter:
         """Check if request is allowed and record the attempt."""
         now = time.time()
         with self._lock:
-            # Evict stale clients if we're tracking too many unique IPs
-            if len(self.requests) > _MAX_TRACKED_CLIENTS:
+            # Evict stale clients if we're tracking too many unique IPs.
+            # Scans are throttled to once per window: entries cannot become
+            # stale any faster, so re-scanning on every call when all tracked
+            # clients are active would just be an O(N) sweep per request.
+            if (
+                len(self.requests) > _MAX_TRACKED_CLIENTS
+                and now - self._last_eviction >= self.window_seconds
+            ):
                 self._evict_stale_clients(now)
+                self._last_eviction = now
 
             self._cleanup(client_id, now)
             timestamps = self.requests[client_id]
@@ -65,7 +76,8 @@ class RateLimiter:
         now = time.time()
         with self._lock:
             self._cleanup(client_id, now)
-            return len(self.requests[client_id]) >= self.max_requests
+            timestamps = self.requests.get(client_id)
+            return timestamps is not None and len(timestamps) >= self.max_requests
 
     def record_attempt(self, client_id: str) -> None:
         """Record an attempt for a client."""
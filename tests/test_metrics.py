@@ -0,0 +1,61 @@
+"""Tests for the in-process Metrics aggregator."""
+
+import pytest
+
+from src.utils.metrics import PREDICTION_LATENCY, Metrics
+
+
+def _histogram_count() -> float:
+    """Read the global prediction-latency histogram's observation count."""
+    for metric in PREDICTION_LATENCY.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_count"):
+                return float(sample.value)
+    return 0.0
+
+
+def test_record_batch_matches_itemwise_recording() -> None:
+    """record_batch must tally exactly like N record_prediction calls."""
+    labels = ["MALICIOUS", "BENIGN", "BENIGN", "UNKNOWN", "MALICIOUS"]
+    per_item_latency = 0.01
+
+    batched = Metrics()
+    batched.record_batch(labels, per_item_latency)
+
+    itemwise = Metrics()
+    for label in labels:
+        itemwise.record_prediction(label, per_item_latency)
+
+    batched_stats = batched.get_stats()
+    itemwise_stats = itemwise.get_stats()
+    for key in (
+        "total_requests",
+        "total_predictions",
+        "predictions_by_class",
+        "errors",
+    ):
+        assert batched_stats[key] == itemwise_stats[key]
+    assert batched_stats["average_latency_ms"] == pytest.approx(
+        itemwise_stats["average_latency_ms"]
+    )
+
+
+def test_record_batch_observes_latency_per_item() -> None:
+    """The Prometheus histogram count grows by one observation per item."""
+    labels = ["MALICIOUS", "BENIGN", "BENIGN"]
+
+    before = _histogram_count()
+    Metrics().record_batch(labels, 0.005)
+
+    assert _histogram_count() - before == len(labels)
+
+
+def test_record_batch_empty_is_noop() -> None:
+    before = _histogram_count()
+    metrics = Metrics()
+    metrics.record_batch([], 0.0)
+
+    stats = metrics.get_stats()
+    assert stats["total_predictions"] == 0
+    assert stats["predictions_by_class"] == {}
+    assert _histogram_count() == before